@@ -13,25 +13,52 @@ Prerequisites:
 """
 
 import os
+import re
+import math
 import sys
 import json
 import asyncio
 import subprocess
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import functools
+import copy
+import types
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Mapping, Optional, Any, AsyncIterator, Literal, TYPE_CHECKING
 import logging
+import importlib
+import importlib.util
+import importlib.metadata
+from dataclasses import dataclass
 
-try:
-    import oci
-    from oci.config import from_file, validate_config
-    from oci.core import ComputeClient
+if TYPE_CHECKING:
+    from oci._vendor import requests
+    from oci.core import ComputeClient, VirtualNetworkClient
     from oci.monitoring import MonitoringClient
-    from oci.core.models import Instance
-    from oci.monitoring.models import SummarizeMetricsDataDetails
-except ImportError as e:
-    print(f"ERROR: OCI Python SDK not installed: {e}")
+
+# Disable the SDK's Expect: 100-Continue handshake, which adds up to 3s per request on
+# affected SDK versions. The SDK reads this when it is imported, so it must be set first.
+os.environ.setdefault("OCI_PYSDK_USING_EXPECT_HEADER", "FALSE")
+
+def lazy_import(name: str):
+    """Bind a module whose body only executes on first attribute access"""
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# The OCI SDK imports hundreds of modules, so it is only loaded when a tool first needs it
+if importlib.util.find_spec("oci") is None:
+    print("ERROR: OCI Python SDK not installed")
     print("Install with: pip install oci")
     sys.exit(1)
+oci = lazy_import("oci")
 
 try:
     from fastmcp import FastMCP
@@ -40,136 +67,569 @@ except ImportError as e:
     print("Install with: pip install fastmcp")
     sys.exit(1)
 
+# orjson parses large CLI JSON output and serializes several times faster than the stdlib
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logging.captureWarnings(True)  # route SDK warnings through the same handlers
 logger = logging.getLogger(__name__)
 
+# OCI SDK releases with the Expect-header latency regression: [first affected, first fixed)
+EXPECT_HEADER_REGRESSION_VERSIONS = ((2, 38, 4), (2, 43, 0))
+
+def oci_sdk_version() -> str:
+    """Installed OCI SDK version, read from package metadata without importing the SDK"""
+    try:
+        return importlib.metadata.version("oci")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+def sdk_version_tuple(version: str) -> tuple:
+    """Parse the numeric major.minor.patch prefix of a version string"""
+    return tuple(int(part) for part in re.findall(r'\d+', version)[:3])
+
+# Shared HTTP settings for all OCI SDK clients
+HTTP_POOL_CONNECTIONS = int(os.environ.get('OCI_HTTP_POOL_CONNECTIONS', '32'))
+HTTP_POOL_MAXSIZE = int(os.environ.get('OCI_HTTP_POOL_MAXSIZE', '64'))
+CLIENT_TIMEOUT = (10, 60)  # (connect, read) seconds
+
+@functools.lru_cache(maxsize=None)
+def client_retry_strategy():
+    """Retry strategy shared by all SDK clients, built on first client construction"""
+    return oci.retry.RetryStrategyBuilder(
+        max_attempts=3,
+        total_elapsed_time_seconds=60
+    ).get_retry_strategy()
+
+# Skip the startup banner; defaults to quiet when stderr is not a terminal (MCP launchers)
+QUIET = (os.getenv("MCP_OCI_QUIET") or ("0" if sys.stderr.isatty() else "1")) == "1"
+
+# Default OCI config file location (same as the SDK's DEFAULT_LOCATION)
+OCI_CONFIG_LOCATION = os.path.join('~', '.oci', 'config')
+
+# Validated OCI config is cached here, keyed by the config file's path, mtime and size
+CONFIG_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache')),
+    'mcp-oci-metrics-server',
+    'oci_config.json'
+)
+
+# How long a test_oci_connection result is served from cache
+HEALTH_TTL_SECONDS = 15.0
+
+# Upper bound on each test_oci_connection service probe
+PROBE_TIMEOUT_SECONDS = 5
+
+# Consecutive compute probe failures that open its circuit breaker, and how long it stays open
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN_SECONDS = 30.0
+
+# Attempts for VNIC lookups that OCI throttles (HTTP 429) or that fail transiently
+THROTTLE_RETRY_ATTEMPTS = 3
+
+# Max instance IDs per batched MQL query (keeps the query under the MQL length limit)
+METRICS_BATCH_SIZE = 50
+
 # Initialize FastMCP server
 mcp = FastMCP("OCI Metrics and Compute Server")
 
+# Public fields serialized for Instance submodels (avoids the private mirrors in __dict__)
+LAUNCH_OPTIONS_FIELDS = (
+    'boot_volume_type', 'firmware', 'network_type', 'remote_data_volume_type',
+    'is_pv_encryption_in_transit_enabled', 'is_consistent_volume_naming_enabled'
+)
+INSTANCE_OPTIONS_FIELDS = ('are_legacy_imds_endpoints_disabled',)
+AVAILABILITY_CONFIG_FIELDS = ('is_live_migration_preferred', 'recovery_action')
+PREEMPTIBLE_CONFIG_FIELDS = ('preemption_action',)
+AGENT_CONFIG_FIELDS = ('is_monitoring_disabled', 'is_management_disabled', 'are_all_plugins_disabled', 'plugins_config')
+
+def model_fields(model, fields: tuple) -> Dict[str, Any]:
+    """Extract the given fields from an OCI SDK model, converting nested models to dicts"""
+    if model is None:
+        return {}
+    return {field: oci.util.to_dict(getattr(model, field, None)) for field in fields}
+
+@functools.lru_cache(maxsize=256)
+def mql_template(metric_name: str, dimension_keys: tuple) -> str:
+    """Build a str.format template for a mean MQL query with one positional slot per dimension value"""
+    def escape(text: str) -> str:
+        return text.replace('{', '{{').replace('}', '}}')
+    
+    dimension_filters = ""
+    if dimension_keys:
+        filters = [f'{escape(key)}="{{{index}}}"' for index, key in enumerate(dimension_keys)]
+        dimension_filters = "{{" + ", ".join(filters) + "}}"
+    
+    return f"{escape(metric_name)}{dimension_filters}[1m].mean()"
+
+def nearest_rank(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list"""
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+def summarize_values(values: List[float]) -> Dict[str, Any]:
+    """Compute count, min, max, mean and nearest-rank p95 of metric values"""
+    if not values:
+        return {'count': 0}
+    
+    ordered = sorted(values)
+    count = len(ordered)
+    return {
+        'count': count,
+        'min': ordered[0],
+        'max': ordered[-1],
+        'mean': math.fsum(ordered) / count,
+        'p95': nearest_rank(ordered, 0.95)
+    }
+
+@dataclass(frozen=True)
+class InstanceRecord:
+    """Compact compute instance record, converted to a dict only at the MCP boundary"""
+    __slots__ = ('id', 'display_name', 'shape', 'lifecycle_state', 'availability_domain', 'compartment_id',
+                 'time_created', 'region', 'image_id', 'fault_domain', 'metadata', 'freeform_tags', 'defined_tags')
+    
+    id: str
+    display_name: str
+    shape: str
+    lifecycle_state: str
+    availability_domain: str
+    compartment_id: str
+    time_created: Optional[str]
+    region: str
+    image_id: str
+    fault_domain: str
+    metadata: Dict
+    freeform_tags: Dict
+    defined_tags: Dict
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the camelCase dict shape returned by the MCP tools"""
+        return {
+            'id': self.id,
+            'displayName': self.display_name,
+            'shape': self.shape,
+            'lifecycleState': self.lifecycle_state,
+            'availabilityDomain': self.availability_domain,
+            'compartmentId': self.compartment_id,
+            'timeCreated': self.time_created,
+            'region': self.region,
+            'imageId': self.image_id,
+            'faultDomain': self.fault_domain,
+            'metadata': self.metadata,
+            'freeformTags': self.freeform_tags,
+            'definedTags': self.defined_tags
+        }
+
+# InstanceRecord fields read from an SDK Instance model (region comes from config instead)
+INSTANCE_SOURCE_FIELDS = tuple(field for field in InstanceRecord.__slots__ if field != 'region')
+
+# Values the CLI fallback has always used when a field is missing from the CLI output
+CLI_INSTANCE_DEFAULTS = {
+    'id': '', 'display_name': 'Unknown', 'shape': 'Unknown', 'lifecycle_state': 'Unknown',
+    'availability_domain': 'Unknown', 'compartment_id': '', 'time_created': '',
+    'image_id': '', 'fault_domain': '', 'metadata': {}, 'freeform_tags': {}, 'defined_tags': {}
+}
+
+def build_instance_record(instance, region: str, *, source: Literal['sdk', 'cli'] = 'sdk') -> InstanceRecord:
+    """Build an InstanceRecord from an SDK Instance model or a hyphen-keyed CLI JSON dict"""
+    if source == 'cli':
+        # Normalize CLI hyphen-keys to SDK attribute names; CLI timestamps are already ISO strings
+        view = dict(CLI_INSTANCE_DEFAULTS)
+        view.update((key.replace('-', '_'), value) for key, value in instance.items())
+        time_created = view['time_created']
+    else:
+        view = {field: getattr(instance, field) for field in INSTANCE_SOURCE_FIELDS}
+        time_created = instance.time_created.isoformat(timespec='seconds') if instance.time_created else None
+    
+    return InstanceRecord(
+        id=view['id'],
+        display_name=view['display_name'],
+        shape=view['shape'],
+        lifecycle_state=view['lifecycle_state'],
+        availability_domain=view['availability_domain'],
+        compartment_id=view['compartment_id'],
+        time_created=time_created,
+        region=region,
+        image_id=view['image_id'],
+        fault_domain=view['fault_domain'],
+        metadata=view['metadata'] or {},
+        freeform_tags=view['freeform_tags'] or {},
+        defined_tags=view['defined_tags'] or {}
+    )
+
 class OCIClientManager:
     """Manages OCI SDK clients with fallback to CLI"""
     
+    __slots__ = (
+        'config', 'capabilities', '_env_compartment', '_compute_client', '_monitoring_client', '_network_client',
+        '_client_lock', '_session', '_vnic_semaphore', '_executor', 'cache_ttl_seconds', '_cache', '_cache_swept_at',
+        '_cache_locks'
+    )
+    
+    # SDK clients by capability: (attribute holding the client, module, class)
+    CLIENT_SPECS = {
+        'compute': ('_compute_client', 'oci.core', 'ComputeClient'),
+        'monitoring': ('_monitoring_client', 'oci.monitoring', 'MonitoringClient'),
+        'network': ('_network_client', 'oci.core', 'VirtualNetworkClient')
+    }
+    
     def __init__(self):
         self.config = None
-        self.compute_client = None
-        self.monitoring_client = None
-        self.network_client = None
+        # Clients that can be constructed; one is dropped if its construction fails
+        self.capabilities = frozenset()
+        # Environment is fixed for the server's lifetime, so read it once
+        self._env_compartment = os.environ.get('OCI_COMPARTMENT_ID')
+        # SDK clients are constructed lazily by their properties
+        self._compute_client = None
+        self._monitoring_client = None
+        self._network_client = None
+        self._client_lock = threading.Lock()
+        self._session = None
+        # Caps concurrent VNIC lookups to stay within OCI API rate limits
+        self._vnic_semaphore = asyncio.Semaphore(int(os.environ.get('OCI_VNIC_CONCURRENCY', '10')))
+        # Blocking SDK calls run here so they don't stall the event loop
+        self._executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="oci-sdk")
+        # TTL cache for quasi-static metadata (instance lists, VNIC details)
+        self.cache_ttl_seconds = float(os.environ.get('OCI_CACHE_TTL', '60'))
+        self._cache: Dict[tuple, tuple] = {}
+        self._cache_swept_at = time.monotonic()
+        self._cache_locks: Dict[tuple, asyncio.Lock] = {}
         self._initialize_clients()
     
     def _initialize_clients(self):
-        """Initialize OCI SDK clients"""
+        """Load and validate OCI config; SDK clients are built lazily on first use"""
         try:
             # Load OCI config from default location
-            self.config = from_file()
-            validate_config(self.config)
+            self.config = self._load_config()
+            self.capabilities = frozenset(self.CLIENT_SPECS)
             
-            # Initialize clients
-            self.compute_client = ComputeClient(self.config)
-            self.monitoring_client = MonitoringClient(self.config)
-            
-            # Import network client for VNIC operations
-            from oci.core import VirtualNetworkClient
-            self.network_client = VirtualNetworkClient(self.config)
-            
-            logger.info("✅ OCI SDK clients initialized successfully")
-            logger.info(f"Region: {self.config.get('region', 'Not specified')}")
-            logger.info(f"Tenancy: {self.config.get('tenancy', 'Not specified')[:20]}...")
+            logger.info("✅ OCI SDK configuration loaded successfully")
+            logger.info("Region: %s", self.config.get('region', 'Not specified'))
+            logger.info("Tenancy: %s...", self.config.get('tenancy', 'Not specified')[:20])
             
         except Exception as e:
-            logger.error(f"❌ Failed to initialize OCI SDK clients: {e}")
+            logger.error("❌ Failed to initialize OCI SDK clients: %s", e)
             logger.warning("Will fall back to CLI commands")
             self.config = None
-            self.compute_client = None
-            self.monitoring_client = None
-            self.network_client = None
     
-    def get_compartment_id(self) -> str:
-        """Get compartment ID from environment or config"""
-        compartment_id = os.environ.get('OCI_COMPARTMENT_ID')
-        if not compartment_id and self.config:
-            # Use tenancy as default compartment if no specific compartment set
-            compartment_id = self.config.get('tenancy')
-        return compartment_id
-    
-    async def list_instances_sdk(self, compartment_id: str, lifecycle_state: str = "RUNNING") -> List[Dict]:
-        """List instances using OCI Python SDK"""
-        if not self.compute_client:
-            raise Exception("OCI SDK not available")
+    @staticmethod
+    def _load_config() -> Dict:
+        """Load and validate the OCI config, reusing a validated copy cached on disk while the file is unchanged"""
+        config_path = os.path.expanduser(OCI_CONFIG_LOCATION)
+        try:
+            stat = os.stat(config_path)
+        except OSError:
+            # Let from_file resolve its fallback locations and report errors
+            config = oci.config.from_file()
+            oci.config.validate_config(config)
+            return config
+        
+        signature = [config_path, stat.st_mtime_ns, stat.st_size]
+        try:
+            with open(CONFIG_CACHE_PATH, 'rb') as f:
+                cached = json_loads(f.read())
+            if cached.get('signature') == signature:
+                return cached['config']
+        except (OSError, ValueError, KeyError):
+            pass
         
+        config = oci.config.from_file(config_path)
+        oci.config.validate_config(config)
+        
+        try:
+            os.makedirs(os.path.dirname(CONFIG_CACHE_PATH), mode=0o700, exist_ok=True)
+            tmp_path = f"{CONFIG_CACHE_PATH}.{os.getpid()}.tmp"
+            # Same permissions as ~/.oci/config, since the cached profile may include a key passphrase
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json_dumps({'signature': signature, 'config': config}))
+            os.replace(tmp_path, CONFIG_CACHE_PATH)
+        except (OSError, TypeError) as e:
+            logger.debug("Could not write OCI config cache: %s", e)
+        
+        return config
+    
+    def has_config(self) -> bool:
+        """Whether OCI config loaded, i.e. SDK clients can be constructed (does not import or build them)"""
+        return self.config is not None
+    
+    @property
+    def compute_client(self) -> Optional["ComputeClient"]:
+        return self._get_client('compute')
+    
+    @property
+    def monitoring_client(self) -> Optional["MonitoringClient"]:
+        return self._get_client('monitoring')
+    
+    @property
+    def network_client(self) -> Optional["VirtualNetworkClient"]:
+        return self._get_client('network')
+    
+    def _get_client(self, capability: str):
+        """Return the client for a capability, constructing it exactly once on first access"""
+        attr, module_name, class_name = self.CLIENT_SPECS[capability]
+        client = getattr(self, attr)
+        if client is None and capability in self.capabilities:
+            with self._client_lock:
+                client = getattr(self, attr)
+                if client is None and capability in self.capabilities:
+                    client = self._build_client(module_name, class_name)
+                    setattr(self, attr, client)
+                    if client is None:
+                        self.capabilities = self.capabilities - {capability}
+        return client
+    
+    def _build_client(self, module_name: str, class_name: str):
+        """Import and construct an SDK client that shares the pooled session, retry strategy and timeouts"""
         try:
-            logger.info(f"Listing instances with SDK - Compartment: {compartment_id}, State: {lifecycle_state}")
+            client_class = getattr(importlib.import_module(module_name), class_name)
+            client = client_class(self.config, retry_strategy=client_retry_strategy(), timeout=CLIENT_TIMEOUT)
             
-            # List instances using SDK
-            response = self.compute_client.list_instances(
-                compartment_id=compartment_id,
-                lifecycle_state=lifecycle_state
-            )
+            # Share one pooled session so keep-alive connections are reused across services
+            if self._session is None:
+                self._session = self._enlarge_pool(client.base_client.session)
+            client.base_client.session = self._session
+            
+            logger.info("✅ %s initialized", class_name)
+            return client
+            
+        except Exception as e:
+            logger.error("❌ Failed to initialize %s: %s", class_name, e)
+            return None
+    
+    @staticmethod
+    def _enlarge_pool(session: "requests.Session") -> "requests.Session":
+        """Remount an SDK-built session's HTTPS adapter with a connection pool sized for concurrent SDK calls"""
+        # Uses the SDK's bundled requests, whose exceptions the SDK wraps and its retry strategy retries
+        from oci._vendor import requests
+        
+        current_adapter = session.adapters.get('https://')
+        # Keep the SDK's own adapter class when it marks itself as carrying OCI transport behavior
+        if getattr(current_adapter, 'preserves_oci_https_adapter_behavior', False):
+            adapter_class = type(current_adapter)
+        else:
+            adapter_class = requests.adapters.HTTPAdapter
+        session.mount('https://', adapter_class(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=getattr(current_adapter, 'max_retries', requests.adapters.DEFAULT_RETRIES)
+        ))
+        return session
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """Describe the shared HTTP connection pool so connection reuse can be checked"""
+        if self._session is None:
+            return {'status': 'not_created'}
+        
+        adapter = self._session.get_adapter('https://')
+        poolmanager = getattr(adapter, 'poolmanager', None)
+        return {
+            'status': 'active',
+            'pool_connections': HTTP_POOL_CONNECTIONS,
+            'pool_maxsize': HTTP_POOL_MAXSIZE,
+            'host_pools': len(poolmanager.pools) if poolmanager is not None else 0,
+            'shared_by': [
+                name for name, client in (
+                    ('compute', self._compute_client),
+                    ('monitoring', self._monitoring_client),
+                    ('network', self._network_client)
+                ) if client is not None and client.base_client.session is self._session
+            ]
+        }
+    
+    async def _call(self, func, *args, **kwargs):
+        """Run a blocking SDK call in the shared thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+    
+    async def _call_throttled(self, func, *args, **kwargs):
+        """Run an SDK call under the VNIC concurrency limit, backing off on 429, 5xx and connection errors
+        
+        This loop is the only retry layer for these calls (the client retry strategy is disabled),
+        since it honors Retry-After and the SDK strategy does not.
+        """
+        kwargs.setdefault('retry_strategy', oci.retry.NoneRetryStrategy())
+        async with self._vnic_semaphore:
+            for attempt in range(THROTTLE_RETRY_ATTEMPTS):
+                try:
+                    return await self._call(func, *args, **kwargs)
+                except (oci.exceptions.ServiceError, oci.exceptions.RequestException) as e:
+                    status = getattr(e, 'status', None)
+                    transient = status is None or status == 429 or status >= 500
+                    if not transient or attempt == THROTTLE_RETRY_ATTEMPTS - 1:
+                        raise
+                    try:
+                        retry_after = float((getattr(e, 'headers', None) or {}).get('retry-after'))
+                    except (TypeError, ValueError):
+                        retry_after = 0.5 * 2 ** attempt
+                    # Sleep while holding the slot so throttling also lowers effective concurrency
+                    logger.warning("OCI request failed (%s), retrying in %.1fs", status or 'connection error', retry_after)
+                    await asyncio.sleep(retry_after)
+    
+    async def _cached(self, key: tuple, coro_factory, ttl: Optional[float] = None):
+        """Return a cached value for key, or await coro_factory() once and cache the result.
+        
+        Concurrent callers for the same key coalesce on a single upstream call. Only
+        successful, non-None results are cached so failures are retried next time.
+        """
+        ttl = self.cache_ttl_seconds if ttl is None else ttl
+        if ttl <= 0:
+            return await coro_factory()
+        
+        entry = self._cache_lookup(key, ttl)
+        if entry:
+            return entry[1]
+        
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                entry = self._cache_lookup(key, ttl)
+                if entry:
+                    return entry[1]
+                
+                value = await coro_factory()
+                if value is not None:
+                    self._cache_store(key, value, ttl)
+                return value
+        finally:
+            # Callers still waiting keep their reference; later callers find the cached value
+            if self._cache_locks.get(key) is lock:
+                del self._cache_locks[key]
+    
+    def _cache_lookup(self, key: tuple, ttl: float) -> Optional[tuple]:
+        """Return the (stored_at, value) cache entry for key if younger than ttl, evicting it if stale"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] < ttl:
+            return entry
+        self._cache.pop(key, None)
+        return None
+    
+    def _cache_store(self, key: tuple, value: Any, ttl: float) -> None:
+        """Cache value for key, sweeping out entries older than ttl at most once per ttl"""
+        now = time.monotonic()
+        if now - self._cache_swept_at >= ttl:
+            self._cache = {k: entry for k, entry in self._cache.items() if now - entry[0] < ttl}
+            self._cache_swept_at = now
+        self._cache[key] = (now, value)
+    
+    def get_compartment_id(self) -> str:
+        """Get compartment ID from environment or config"""
+        # Use tenancy as default compartment if no specific compartment set
+        return self._env_compartment or (self.config.get('tenancy') if self.config else None)
+    
+    async def list_instances_sdk(self, compartment_id: str, lifecycle_state: str = "RUNNING",
+                                 limit: Optional[int] = None) -> List[InstanceRecord]:
+        """List instances using OCI Python SDK (cached for cache_ttl_seconds)
+        
+        With a limit, pages are streamed and fetching stops once enough instances have arrived.
+        """
+        if limit:
+            cached = self._cache_lookup(('instances', compartment_id, lifecycle_state), self.cache_ttl_seconds)
+            if cached:
+                return cached[1][:limit]
             
             instances = []
-            for instance in response.data:
-                instance_data = {
-                    'id': instance.id,
-                    'displayName': instance.display_name,
-                    'shape': instance.shape,
-                    'lifecycleState': instance.lifecycle_state,
-                    'availabilityDomain': instance.availability_domain,
-                    'compartmentId': instance.compartment_id,
-                    'timeCreated': instance.time_created.isoformat() if instance.time_created else None,
-                    'region': self.config.get('region', 'unknown'),
-                    'imageId': instance.image_id,
-                    'faultDomain': instance.fault_domain,
-                    'metadata': instance.metadata or {},
-                    'freeformTags': instance.freeform_tags or {},
-                    'definedTags': instance.defined_tags or {}
-                }
-                instances.append(instance_data)
+            async for instance in self.iter_instances_sdk(compartment_id, lifecycle_state):
+                instances.append(instance)
+                if len(instances) >= limit:
+                    break
+            return instances
+        
+        return await self._cached(
+            ('instances', compartment_id, lifecycle_state),
+            lambda: self._fetch_instances_sdk(compartment_id, lifecycle_state)
+        )
+    
+    async def _fetch_instances_sdk(self, compartment_id: str, lifecycle_state: str) -> List[InstanceRecord]:
+        """List instances from OCI without caching"""
+        try:
+            instances = [instance async for instance in self.iter_instances_sdk(compartment_id, lifecycle_state)]
             
-            logger.info(f"✅ Found {len(instances)} instances via SDK")
+            logger.info("✅ Found %s instances via SDK", len(instances))
             return instances
             
         except Exception as e:
-            logger.error(f"SDK failed: {e}")
+            logger.error("SDK failed: %s", e)
             raise
     
+    async def iter_instances_sdk(self, compartment_id: str, lifecycle_state: str = "RUNNING") -> AsyncIterator[InstanceRecord]:
+        """Yield instances page by page as they arrive from OCI"""
+        if not self.compute_client:
+            raise Exception("OCI SDK not available")
+        
+        logger.info("Listing instances with SDK - Compartment: %s, State: %s", compartment_id, lifecycle_state)
+        
+        region = self.config.get('region', 'unknown')
+        # Page manually: the SDK pagination helpers wrap each call in their own retry strategy,
+        # which would stack on top of the client's
+        page = None
+        while True:
+            response = await self._call(
+                self.compute_client.list_instances,
+                compartment_id=compartment_id,
+                lifecycle_state=lifecycle_state,
+                page=page
+            )
+            for instance in response.data:
+                yield build_instance_record(instance, region)
+            
+            if not response.has_next_page:
+                break
+            page = response.next_page
+    
+    async def probe_instances_sdk(self, compartment_id: str, lifecycle_state: str = "RUNNING") -> Any:
+        """Cheaply check instance listing with a single limit=1 page and no retries
+        
+        Returns the instance count if the first page is complete, or '>=1' if more pages exist.
+        """
+        if not self.compute_client:
+            raise Exception("OCI SDK not available")
+        
+        response = await self._call(
+            self.compute_client.list_instances,
+            compartment_id=compartment_id,
+            lifecycle_state=lifecycle_state,
+            limit=1,
+            retry_strategy=oci.retry.NoneRetryStrategy()
+        )
+        return '>=1' if response.data and response.has_next_page else len(response.data)
+    
     async def get_instance_details_sdk(self, instance_id: str) -> Dict:
         """Get instance details using OCI Python SDK"""
         if not self.compute_client:
             raise Exception("OCI SDK not available")
         
         try:
-            logger.info(f"Getting instance details via SDK: {instance_id}")
+            logger.info("Getting instance details via SDK: %s", instance_id)
             
-            response = self.compute_client.get_instance(instance_id=instance_id)
+            response = await self._call(self.compute_client.get_instance, instance_id=instance_id)
             instance = response.data
             
-            instance_data = {
-                'id': instance.id,
-                'displayName': instance.display_name,
-                'shape': instance.shape,
-                'lifecycleState': instance.lifecycle_state,
-                'availabilityDomain': instance.availability_domain,
-                'compartmentId': instance.compartment_id,
-                'timeCreated': instance.time_created.isoformat() if instance.time_created else None,
-                'region': self.config.get('region', 'unknown'),
-                'imageId': instance.image_id,
-                'faultDomain': instance.fault_domain,
-                'metadata': instance.metadata or {},
+            instance_data = build_instance_record(instance, self.config.get('region', 'unknown')).to_dict()
+            instance_data.update({
                 'extendedMetadata': instance.extended_metadata or {},
-                'freeformTags': instance.freeform_tags or {},
-                'definedTags': instance.defined_tags or {},
-                'launchOptions': instance.launch_options.__dict__ if instance.launch_options else {},
-                'instanceOptions': instance.instance_options.__dict__ if instance.instance_options else {},
-                'availabilityConfig': instance.availability_config.__dict__ if instance.availability_config else {},
-                'preemptibleInstanceConfig': instance.preemptible_instance_config.__dict__ if instance.preemptible_instance_config else {},
-                'agentConfig': instance.agent_config.__dict__ if instance.agent_config else {}
-            }
+                'launchOptions': model_fields(instance.launch_options, LAUNCH_OPTIONS_FIELDS),
+                'instanceOptions': model_fields(instance.instance_options, INSTANCE_OPTIONS_FIELDS),
+                'availabilityConfig': model_fields(instance.availability_config, AVAILABILITY_CONFIG_FIELDS),
+                'preemptibleInstanceConfig': model_fields(instance.preemptible_instance_config, PREEMPTIBLE_CONFIG_FIELDS),
+                'agentConfig': model_fields(instance.agent_config, AGENT_CONFIG_FIELDS)
+            })
             
-            logger.info(f"✅ Retrieved instance details via SDK")
+            logger.info("✅ Retrieved instance details via SDK")
             return instance_data
             
         except Exception as e:
-            logger.error(f"SDK failed: {e}")
+            logger.error("SDK failed: %s", e)
             raise
     
     async def get_vnic_attachments_sdk(self, instance_id: str, compartment_id: str) -> List[Dict]:
@@ -178,7 +638,8 @@ class OCIClientManager:
             raise Exception("OCI SDK not available")
         
         try:
-            response = self.compute_client.list_vnic_attachments(
+            response = await self._call_throttled(
+                self.compute_client.list_vnic_attachments,
                 compartment_id=compartment_id,
                 instance_id=instance_id
             )
@@ -200,16 +661,20 @@ class OCIClientManager:
             return vnics
             
         except Exception as e:
-            logger.error(f"Failed to get VNIC attachments: {e}")
+            logger.error("Failed to get VNIC attachments: %s", e)
             return []
     
     async def get_vnic_details_sdk(self, vnic_id: str) -> Optional[Dict]:
-        """Get VNIC details using OCI Python SDK"""
+        """Get VNIC details using OCI Python SDK (cached for cache_ttl_seconds)"""
+        return await self._cached(('vnic', vnic_id), lambda: self._fetch_vnic_details_sdk(vnic_id))
+    
+    async def _fetch_vnic_details_sdk(self, vnic_id: str) -> Optional[Dict]:
+        """Get VNIC details from OCI without caching"""
         if not self.network_client:
             raise Exception("OCI Network client not available")
         
         try:
-            response = self.network_client.get_vnic(vnic_id=vnic_id)
+            response = await self._call_throttled(self.network_client.get_vnic, vnic_id=vnic_id)
             vnic = response.data
             
             vnic_data = {
@@ -223,61 +688,70 @@ class OCIClientManager:
                 'subnetId': vnic.subnet_id,
                 'lifecycleState': vnic.lifecycle_state,
                 'skipSourceDestCheck': vnic.skip_source_dest_check,
-                'timeCreated': vnic.time_created.isoformat() if vnic.time_created else None,
+                'timeCreated': vnic.time_created.isoformat(timespec='seconds') if vnic.time_created else None,
                 'nsgIds': vnic.nsg_ids or []
             }
             
             return vnic_data
             
         except Exception as e:
-            logger.error(f"Failed to get VNIC details: {e}")
+            logger.error("Failed to get VNIC details: %s", e)
             return None
     
     async def list_instances_with_network_sdk(self, compartment_id: str, lifecycle_state: str = "RUNNING") -> List[Dict]:
         """List instances with network information using OCI Python SDK"""
-        instances = await self.list_instances_sdk(compartment_id, lifecycle_state)
+        instances = [instance.to_dict() for instance in await self.list_instances_sdk(compartment_id, lifecycle_state)]
+        await self.add_network_info_sdk(instances, compartment_id)
+        return instances
+    
+    async def add_network_info_sdk(self, instances: List[Dict], compartment_id: str) -> None:
+        """Attach VNIC network information to instance dicts in two concurrent waves"""
+        # Wave 1: VNIC attachments for every instance
+        attachments_per_instance = await asyncio.gather(
+            *[self.get_vnic_attachments_sdk(instance['id'], compartment_id) for instance in instances],
+            return_exceptions=True
+        )
         
-        # Enhance with network information
-        for instance in instances:
-            try:
-                # Get VNIC attachments
-                vnic_attachments = await self.get_vnic_attachments_sdk(instance['id'], compartment_id)
-                
-                # Get network details for each VNIC
-                network_info = []
-                for vnic_attachment in vnic_attachments:
-                    vnic_details = await self.get_vnic_details_sdk(vnic_attachment['vnicId'])
-                    if vnic_details:
-                        network_info.append({
-                            'isPrimary': vnic_details['isPrimary'],
-                            'privateIp': vnic_details['privateIp'],
-                            'publicIp': vnic_details['publicIp'],
-                            'hostname': vnic_details['hostname'],
-                            'macAddress': vnic_details['macAddress'],
-                            'nicIndex': vnic_attachment['nicIndex']
-                        })
-                
-                instance['networkInfo'] = network_info
-                
-                # Add primary IP addresses for easy access
-                primary_vnic = next((ni for ni in network_info if ni['isPrimary']), None)
-                if primary_vnic:
-                    instance['primaryPrivateIp'] = primary_vnic['privateIp']
-                    instance['primaryPublicIp'] = primary_vnic['publicIp']
-                    instance['hostname'] = primary_vnic['hostname']
-                else:
-                    instance['primaryPrivateIp'] = None
-                    instance['primaryPublicIp'] = None
-                    instance['hostname'] = None
-                    
-            except Exception as e:
-                logger.warning(f"Failed to get network info for instance {instance['id']}: {e}")
-                instance['networkInfo'] = []
-                instance['primaryPrivateIp'] = None
-                instance['primaryPublicIp'] = None
-                instance['hostname'] = None
+        # Wave 2: VNIC details for every attachment across all instances
+        flat = [
+            (inst_idx, vnic_attachment)
+            for inst_idx, vnic_attachments in enumerate(attachments_per_instance)
+            if not isinstance(vnic_attachments, BaseException)
+            for vnic_attachment in vnic_attachments
+        ]
+        vnic_details_list = await asyncio.gather(
+            *[self.get_vnic_details_sdk(vnic_attachment['vnicId']) for _, vnic_attachment in flat],
+            return_exceptions=True
+        )
         
-        return instances
+        # Scatter results back to their instances, noting each primary VNIC in the same pass
+        network_infos = [[] for _ in instances]
+        primary_vnics = [None] * len(instances)
+        for (inst_idx, vnic_attachment), vnic_details in zip(flat, vnic_details_list):
+            if vnic_details and not isinstance(vnic_details, BaseException):
+                network_entry = {
+                    'isPrimary': vnic_details['isPrimary'],
+                    'privateIp': vnic_details['privateIp'],
+                    'publicIp': vnic_details['publicIp'],
+                    'hostname': vnic_details['hostname'],
+                    'macAddress': vnic_details['macAddress'],
+                    'nicIndex': vnic_attachment['nicIndex']
+                }
+                network_infos[inst_idx].append(network_entry)
+                if network_entry['isPrimary'] and primary_vnics[inst_idx] is None:
+                    primary_vnics[inst_idx] = network_entry
+        
+        for instance, vnic_attachments, network_info, primary_vnic in zip(
+                instances, attachments_per_instance, network_infos, primary_vnics):
+            if isinstance(vnic_attachments, BaseException):
+                logger.warning("Failed to get network info for instance %s: %s", instance['id'], vnic_attachments)
+            
+            instance['networkInfo'] = network_info
+            
+            # Add primary IP addresses for easy access
+            instance['primaryPrivateIp'] = primary_vnic['privateIp'] if primary_vnic else None
+            instance['primaryPublicIp'] = primary_vnic['publicIp'] if primary_vnic else None
+            instance['hostname'] = primary_vnic['hostname'] if primary_vnic else None
     
     async def query_metrics_sdk(self, namespace: str, metric_name: str, start_time: datetime, 
                                end_time: datetime, compartment_id: str, dimensions: Dict[str, str] = None) -> Dict:
@@ -286,16 +760,12 @@ class OCIClientManager:
             raise Exception("OCI Monitoring client not available")
         
         try:
-            # Build MQL query string
-            dimension_filters = ""
-            if dimensions:
-                filters = [f'{key}="{value}"' for key, value in dimensions.items()]
-                dimension_filters = "{" + ", ".join(filters) + "}"
-            
-            mql_query = f"{metric_name}{dimension_filters}[1m].mean()"
+            # Build MQL query string from the cached template for this metric and dimension set
+            dimension_keys = tuple(sorted(dimensions)) if dimensions else ()
+            mql_query = mql_template(metric_name, dimension_keys).format(*[dimensions[key] for key in dimension_keys])
             
             # Create summarize request
-            details = SummarizeMetricsDataDetails(
+            details = oci.monitoring.models.SummarizeMetricsDataDetails(
                 namespace=namespace,
                 query=mql_query,
                 start_time=start_time,
@@ -303,37 +773,86 @@ class OCIClientManager:
                 resolution="PT1M"
             )
             
-            response = self.monitoring_client.summarize_metrics_data(
+            response = await self._call(
+                self.monitoring_client.summarize_metrics_data,
                 compartment_id=compartment_id,
                 summarize_metrics_data_details=details
             )
             
-            # Process response
+            # Process response, collecting raw values for the rollup in the same pass
             metrics_data = []
+            values = []
             for metric in response.data:
                 for datapoint in metric.aggregated_datapoints:
                     metrics_data.append({
-                        'timestamp': datapoint.timestamp.isoformat(),
+                        'timestamp': datapoint.timestamp.isoformat(timespec='seconds'),
                         'value': datapoint.value,
                         'dimensions': dimensions or {}
                     })
+                    if datapoint.value is not None:
+                        values.append(datapoint.value)
             
             return {
                 'namespace': namespace,
                 'metricName': metric_name,
                 'dimensions': dimensions or {},
                 'aggregatedDatapoints': metrics_data,
-                'retrievedAt': datetime.utcnow().isoformat()
+                'statistics': summarize_values(values),
+                'retrievedAt': utc_timestamp()
             }
             
         except Exception as e:
-            logger.error(f"Failed to query metrics via SDK: {e}")
+            logger.error("Failed to query metrics via SDK: %s", e)
             raise
     
-    async def list_instances_cli_fallback(self, compartment_id: str, lifecycle_state: str = "RUNNING") -> List[Dict]:
+    async def query_metrics_batch_sdk(self, namespace: str, metric_name: str, instance_ids: List[str],
+                                      start_time: datetime, end_time: datetime, compartment_id: str) -> Dict[str, List[Dict]]:
+        """Query one metric for many instances with one MQL request per sub-batch of instance IDs"""
+        if not self.monitoring_client:
+            raise Exception("OCI Monitoring client not available")
+        
+        async def query_batch(batch_ids: List[str]) -> List:
+            resource_filter = "|".join(batch_ids)
+            details = oci.monitoring.models.SummarizeMetricsDataDetails(
+                namespace=namespace,
+                query=f'{metric_name}[1m]{{resourceId =~ "{resource_filter}"}}.groupBy(resourceId).mean()',
+                start_time=start_time,
+                end_time=end_time,
+                resolution="PT1M"
+            )
+            response = await self._call(
+                self.monitoring_client.summarize_metrics_data,
+                compartment_id=compartment_id,
+                summarize_metrics_data_details=details
+            )
+            return response.data
+        
+        try:
+            batches = [instance_ids[i:i + METRICS_BATCH_SIZE] for i in range(0, len(instance_ids), METRICS_BATCH_SIZE)]
+            batch_results = await asyncio.gather(*[query_batch(batch) for batch in batches])
+            
+            # Demultiplex returned metric streams by resourceId
+            datapoints_by_instance = {instance_id: [] for instance_id in instance_ids}
+            for metrics in batch_results:
+                for metric in metrics:
+                    resource_id = (metric.dimensions or {}).get('resourceId')
+                    if resource_id not in datapoints_by_instance:
+                        continue
+                    datapoints_by_instance[resource_id].extend(
+                        {'timestamp': datapoint.timestamp.isoformat(timespec='seconds'), 'value': datapoint.value}
+                        for datapoint in metric.aggregated_datapoints
+                    )
+            
+            return datapoints_by_instance
+            
+        except Exception as e:
+            logger.error("Failed to query batch metrics via SDK: %s", e)
+            raise
+    
+    async def list_instances_cli_fallback(self, compartment_id: str, lifecycle_state: str = "RUNNING") -> List[InstanceRecord]:
         """Fallback to CLI for listing instances"""
         try:
-            logger.info(f"Using CLI fallback for listing instances")
+            logger.info("Using CLI fallback for listing instances")
             
             cmd = [
                 'oci', 'compute', 'instance', 'list',
@@ -345,7 +864,7 @@ class OCIClientManager:
             env = os.environ.copy()
             env['SUPPRESS_LABEL_WARNING'] = 'True'
             
-            result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+            result = await self._call(subprocess.run, cmd, capture_output=True, text=True, env=env)
             
             if result.returncode != 0:
                 raise Exception(f"CLI command failed: {result.stderr}")
@@ -353,84 +872,108 @@ class OCIClientManager:
             if not result.stdout.strip():
                 return []
             
-            response = json.loads(result.stdout)
+            response = json_loads(result.stdout)
             instances = []
             
             for instance_data in response.get('data', []):
-                instance = {
-                    'id': instance_data.get('id', ''),
-                    'displayName': instance_data.get('display-name', 'Unknown'),
-                    'shape': instance_data.get('shape', 'Unknown'),
-                    'lifecycleState': instance_data.get('lifecycle-state', 'Unknown'),
-                    'availabilityDomain': instance_data.get('availability-domain', 'Unknown'),
-                    'compartmentId': instance_data.get('compartment-id', ''),
-                    'timeCreated': instance_data.get('time-created', ''),
-                    'region': 'unknown',  # CLI doesn't return region directly
-                    'imageId': instance_data.get('image-id', ''),
-                    'faultDomain': instance_data.get('fault-domain', ''),
-                    'metadata': instance_data.get('metadata', {}),
-                    'freeformTags': instance_data.get('freeform-tags', {}),
-                    'definedTags': instance_data.get('defined-tags', {})
-                }
-                instances.append(instance)
+                # CLI doesn't return region directly
+                instances.append(build_instance_record(instance_data, 'unknown', source='cli'))
             
-            logger.info(f"✅ Found {len(instances)} instances via CLI")
+            logger.info("✅ Found %s instances via CLI", len(instances))
             return instances
             
         except Exception as e:
-            logger.error(f"CLI fallback failed: {e}")
+            logger.error("CLI fallback failed: %s", e)
             raise
 
+# Relative time offsets like "30m", "1h", "7d", "2w" and their unit sizes in seconds
+RELATIVE_TIME_PATTERN = re.compile(r'^(\d+)([smhdw])$')
+RELATIVE_TIME_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+def parse_time_range(start_time: str, end_time: str = None) -> tuple:
+    """Parse a start time (ISO 8601 or relative like "30m", "1h", "7d") and optional ISO end time"""
+    now = datetime.now(timezone.utc)
+    
+    match = RELATIVE_TIME_PATTERN.match(start_time)
+    if match:
+        start_dt = now - timedelta(seconds=int(match.group(1)) * RELATIVE_TIME_UNITS[match.group(2)])
+    else:
+        start_dt = parse_utc_timestamp(start_time)
+    
+    end_dt = parse_utc_timestamp(end_time) if end_time else now
+    return start_dt, end_dt
+
+def parse_utc_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, treating one without an offset as UTC"""
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def short_error(error: BaseException, limit: int = 100) -> str:
+    """Bounded error description; prefers an SDK error's message over str(), which embeds the full response"""
+    text = getattr(error, 'message', None) or str(error) or type(error).__name__
+    return text[:limit] + '...' if len(text) > limit else text
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with seconds precision"""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
 # Initialize OCI client manager
 oci_manager = OCIClientManager()
 
 @mcp.tool()
-async def list_compute_instances(compartment_id: str = None, lifecycle_state: str = "RUNNING") -> Dict[str, Any]:
+async def list_compute_instances(compartment_id: str = None, lifecycle_state: str = "RUNNING",
+                                 limit: int = None) -> Dict[str, Any]:
     """
     List all compute instances in the compartment with basic details.
     
     Args:
         compartment_id: OCI compartment ID (uses default if not provided)
         lifecycle_state: Filter instances by lifecycle state (RUNNING, STOPPED, etc.)
+        limit: Return at most this many instances, stopping pagination early (all if not provided)
     
     Returns:
-        Dictionary with 'summary' (human-readable text), 'instance_count', 'instances' (detailed data), 'method', and 'success'
+        Dictionary with 'summary' (human-readable text), 'instance_count', 'instances' (detailed data),
+        'shape_breakdown' and 'availability_domain_breakdown' (instance counts), 'method', and 'success'
     """
     try:
         target_compartment = compartment_id or oci_manager.get_compartment_id()
         if not target_compartment:
             raise Exception("Compartment ID is required")
         
-        # Prefer SDK, fallback to CLI
-        try:
-            instances = await oci_manager.list_instances_sdk(target_compartment, lifecycle_state)
-        except Exception as sdk_error:
-            logger.warning(f"SDK failed, trying CLI: {sdk_error}")
+        # Prefer SDK (transient errors are retried by the client retry strategy), CLI only when
+        # the SDK could not be initialized
+        if oci_manager.compute_client:
+            instances = await oci_manager.list_instances_sdk(target_compartment, lifecycle_state, limit)
+        else:
             instances = await oci_manager.list_instances_cli_fallback(target_compartment, lifecycle_state)
+            if limit:
+                instances = instances[:limit]
         
         # Create LLM-friendly summary
-        summary_lines = [
-            f"Found {len(instances)} running compute instances in Frankfurt (eu-frankfurt-1):",
-            ""
-        ]
+        summary_lines = [f"Found {len(instances)} running compute instances in Frankfurt (eu-frankfurt-1):\n\n"]
         
+        # Per-shape and per-AD counts are accumulated in the same pass as the summary
+        shape_counts = {}
+        ad_counts = {}
         for i, instance in enumerate(instances, 1):
-            summary_lines.append(f"{i:2d}. {instance['displayName']} ({instance['shape']}) - {instance['lifecycleState']}")
-        
-        summary_lines.extend([
-            "",
-            f"Retrieved using: {'OCI Python SDK' if oci_manager.compute_client else 'OCI CLI'}",
-            f"Compartment: {target_compartment}",
-            f"Retrieved at: {datetime.utcnow().isoformat()}"
-        ])
+            summary_lines.append(f"{i:2d}. {instance.display_name} ({instance.shape}) - {instance.lifecycle_state}\n")
+            shape_counts[instance.shape] = shape_counts.get(instance.shape, 0) + 1
+            ad_counts[instance.availability_domain] = ad_counts.get(instance.availability_domain, 0) + 1
+        summary_lines.append(
+            f"\nRetrieved using: {'OCI Python SDK' if oci_manager.compute_client else 'OCI CLI'}\n"
+            f"Compartment: {target_compartment}\n"
+            f"Retrieved at: {utc_timestamp()}"
+        )
         
-        summary_text = "\n".join(summary_lines)
+        summary_text = "".join(summary_lines)
         
         # Return both human-readable summary and structured data
         response = {
             'summary': summary_text,
             'instance_count': len(instances),
-            'instances': instances,
+            'instances': [instance.to_dict() for instance in instances],
+            'shape_breakdown': shape_counts,
+            'availability_domain_breakdown': ad_counts,
             'method': 'SDK' if oci_manager.compute_client else 'CLI',
             'success': True
         }
@@ -438,7 +981,7 @@ async def list_compute_instances(compartment_id: str = None, lifecycle_state: st
         return response
         
     except Exception as e:
-        logger.error(f"Error listing compute instances: {e}")
+        logger.error("Error listing compute instances: %s", e)
         error_message = f"❌ Failed to list compute instances: {str(e)}"
         return {
             'summary': error_message,
@@ -459,7 +1002,8 @@ async def list_instances_with_network(compartment_id: str = None, lifecycle_stat
         lifecycle_state: Filter instances by lifecycle state (RUNNING, STOPPED, etc.)
     
     Returns:
-        Dictionary with 'summary' (human-readable text with network details), 'instance_count', 'instances' (detailed data), 'includes_network_info', 'method', and 'success'
+        Dictionary with 'summary' (human-readable text with network details), 'instance_count', 'instances' (detailed data),
+        'shape_breakdown' and 'availability_domain_breakdown' (instance counts), 'includes_network_info', 'method', and 'success'
     """
     try:
         target_compartment = compartment_id or oci_manager.get_compartment_id()
@@ -472,7 +1016,8 @@ async def list_instances_with_network(compartment_id: str = None, lifecycle_stat
             method = 'SDK'
         else:
             logger.warning("Network information requires OCI SDK, falling back to basic instance list")
-            instances = await oci_manager.list_instances_cli_fallback(target_compartment, lifecycle_state)
+            records = await oci_manager.list_instances_cli_fallback(target_compartment, lifecycle_state)
+            instances = [record.to_dict() for record in records]
             # Add empty network info for CLI fallback
             for instance in instances:
                 instance['networkInfo'] = []
@@ -482,36 +1027,35 @@ async def list_instances_with_network(compartment_id: str = None, lifecycle_stat
             method = 'CLI (limited)'
         
         # Create LLM-friendly summary with network info
-        summary_lines = [
-            f"Found {len(instances)} compute instances with network information:",
-            ""
-        ]
+        summary_lines = [f"Found {len(instances)} compute instances with network information:\n\n"]
         
+        # Per-shape and per-AD counts are accumulated in the same pass as the summary
+        shape_counts = {}
+        ad_counts = {}
         for i, instance in enumerate(instances, 1):
-            name = instance['displayName']
-            shape = instance['shape']
-            private_ip = instance.get('primaryPrivateIp', 'N/A')
-            public_ip = instance.get('primaryPublicIp', 'None')
-            hostname = instance.get('hostname', 'N/A')
-            
-            summary_lines.append(f"{i:2d}. {name} ({shape})")
-            summary_lines.append(f"    Private IP: {private_ip}")
-            summary_lines.append(f"    Public IP: {public_ip}")
-            summary_lines.append(f"    Hostname: {hostname}")
-            summary_lines.append("")
-        
-        summary_lines.extend([
-            f"Network info included: {'Yes' if oci_manager.network_client else 'No (requires SDK)'}",
-            f"Retrieved using: {method}",
-            f"Retrieved at: {datetime.utcnow().isoformat()}"
-        ])
+            shape_counts[instance['shape']] = shape_counts.get(instance['shape'], 0) + 1
+            ad_counts[instance['availabilityDomain']] = ad_counts.get(instance['availabilityDomain'], 0) + 1
+            summary_lines.append(
+                f"{i:2d}. {instance['displayName']} ({instance['shape']})\n"
+                f"    Private IP: {instance.get('primaryPrivateIp', 'N/A')}\n"
+                f"    Public IP: {instance.get('primaryPublicIp', 'None')}\n"
+                f"    Hostname: {instance.get('hostname', 'N/A')}\n\n"
+            )
+        
+        summary_lines.append(
+            f"Network info included: {'Yes' if oci_manager.network_client else 'No (requires SDK)'}\n"
+            f"Retrieved using: {method}\n"
+            f"Retrieved at: {utc_timestamp()}"
+        )
         
-        summary_text = "\n".join(summary_lines)
+        summary_text = "".join(summary_lines)
         
         response = {
             'summary': summary_text,
             'instance_count': len(instances),
             'instances': instances,
+            'shape_breakdown': shape_counts,
+            'availability_domain_breakdown': ad_counts,
             'includes_network_info': oci_manager.network_client is not None,
             'method': method,
             'success': True
@@ -520,7 +1064,7 @@ async def list_instances_with_network(compartment_id: str = None, lifecycle_stat
         return response
         
     except Exception as e:
-        logger.error(f"Error listing instances with network info: {e}")
+        logger.error("Error listing instances with network info: %s", e)
         error_message = f"❌ Failed to list instances with network info: {str(e)}"
         return {
             'summary': error_message,
@@ -559,32 +1103,9 @@ async def get_instance_details(instance_id: str, compartment_id: str = None, inc
         # Add network information if requested and available
         if include_network and oci_manager.network_client:
             try:
-                vnic_attachments = await oci_manager.get_vnic_attachments_sdk(instance_id, target_compartment)
-                network_info = []
-                
-                for vnic_attachment in vnic_attachments:
-                    vnic_details = await oci_manager.get_vnic_details_sdk(vnic_attachment['vnicId'])
-                    if vnic_details:
-                        network_info.append({
-                            'isPrimary': vnic_details['isPrimary'],
-                            'privateIp': vnic_details['privateIp'],
-                            'publicIp': vnic_details['publicIp'],
-                            'hostname': vnic_details['hostname'],
-                            'macAddress': vnic_details['macAddress'],
-                            'nicIndex': vnic_attachment['nicIndex']
-                        })
-                
-                instance['networkInfo'] = network_info
-                
-                # Add primary IP addresses
-                primary_vnic = next((ni for ni in network_info if ni['isPrimary']), None)
-                if primary_vnic:
-                    instance['primaryPrivateIp'] = primary_vnic['privateIp']
-                    instance['primaryPublicIp'] = primary_vnic['publicIp']
-                    instance['hostname'] = primary_vnic['hostname']
-                
+                await oci_manager.add_network_info_sdk([instance], target_compartment)
             except Exception as e:
-                logger.warning(f"Failed to get network info: {e}")
+                logger.warning("Failed to get network info: %s", e)
                 instance['networkInfo'] = []
         
         response = {
@@ -592,7 +1113,7 @@ async def get_instance_details(instance_id: str, compartment_id: str = None, inc
             'includesNetworkInfo': include_network and oci_manager.network_client is not None,
             'method': method,
             'loganCompatible': True,
-            'retrievedAt': datetime.utcnow().isoformat(),
+            'retrievedAt': utc_timestamp(),
             'service': 'OCI Core Services',
             'operationType': 'get_instance_details'
         }
@@ -600,11 +1121,11 @@ async def get_instance_details(instance_id: str, compartment_id: str = None, inc
         return response
         
     except Exception as e:
-        logger.error(f"Error getting instance details: {e}")
+        logger.error("Error getting instance details: %s", e)
         return {
             'error': f"Failed to get instance details: {str(e)}",
             'success': False,
-            'retrievedAt': datetime.utcnow().isoformat()
+            'retrievedAt': utc_timestamp()
         }
 
 @mcp.tool()
@@ -616,7 +1137,7 @@ async def query_compute_metrics(instance_id: str, metric_name: str, start_time:
     Args:
         instance_id: OCI Compute instance OCID
         metric_name: Metric name (e.g., CpuUtilization, MemoryUtilization)
-        start_time: Start time (ISO 8601 or relative like "1h", "24h")
+        start_time: Start time (ISO 8601 or relative like "30m", "1h", "7d")
         end_time: End time (ISO 8601, defaults to now)
         compartment_id: OCI compartment ID (uses default if not provided)
     
@@ -628,17 +1149,7 @@ async def query_compute_metrics(instance_id: str, metric_name: str, start_time:
         if not target_compartment:
             raise Exception("Compartment ID is required")
         
-        # Parse time parameters
-        if start_time.endswith('h'):
-            hours = int(start_time[:-1])
-            start_dt = datetime.utcnow() - timedelta(hours=hours)
-        elif start_time.endswith('d'):
-            days = int(start_time[:-1])
-            start_dt = datetime.utcnow() - timedelta(days=days)
-        else:
-            start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-        
-        end_dt = datetime.utcnow() if not end_time else datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+        start_dt, end_dt = parse_time_range(start_time, end_time)
         
         # Query metrics using SDK
         if oci_manager.monitoring_client:
@@ -667,7 +1178,7 @@ async def query_compute_metrics(instance_id: str, metric_name: str, start_time:
             },
             'method': method,
             'loganCompatible': True,
-            'retrievedAt': datetime.utcnow().isoformat(),
+            'retrievedAt': utc_timestamp(),
             'service': 'OCI Monitoring',
             'operationType': 'query_compute_metrics'
         }
@@ -675,116 +1186,361 @@ async def query_compute_metrics(instance_id: str, metric_name: str, start_time:
         return response
         
     except Exception as e:
-        logger.error(f"Error querying compute metrics: {e}")
+        logger.error("Error querying compute metrics: %s", e)
         return {
             'error': f"Failed to query compute metrics: {str(e)}",
             'success': False,
-            'retrievedAt': datetime.utcnow().isoformat()
+            'retrievedAt': utc_timestamp()
+        }
+
+@mcp.tool()
+async def query_compute_metrics_batch(instance_ids: List[str], metric_name: str, start_time: str,
+                                      end_time: str = None, compartment_id: str = None) -> Dict[str, Any]:
+    """
+    Query one OCI Compute Agent metric for many instances in batched requests.
+    
+    Args:
+        instance_ids: List of OCI Compute instance OCIDs
+        metric_name: Metric name (e.g., CpuUtilization, MemoryUtilization)
+        start_time: Start time (ISO 8601 or relative like "30m", "1h", "7d")
+        end_time: End time (ISO 8601, defaults to now)
+        compartment_id: OCI compartment ID (uses default if not provided)
+    
+    Returns:
+        Dictionary containing metric data points keyed by instance ID
+    """
+    try:
+        target_compartment = compartment_id or oci_manager.get_compartment_id()
+        if not target_compartment:
+            raise Exception("Compartment ID is required")
+        
+        start_dt, end_dt = parse_time_range(start_time, end_time)
+        
+        if oci_manager.monitoring_client:
+            datapoints_by_instance = await oci_manager.query_metrics_batch_sdk(
+                namespace='oci_computeagent',
+                metric_name=metric_name,
+                instance_ids=instance_ids,
+                start_time=start_dt,
+                end_time=end_dt,
+                compartment_id=target_compartment
+            )
+            method = 'SDK'
+        else:
+            raise Exception("Metrics querying requires OCI SDK")
+        
+        response = {
+            'metrics': datapoints_by_instance,
+            'query': {
+                'instanceIds': instance_ids,
+                'metricName': metric_name,
+                'namespace': 'oci_computeagent',
+                'startTime': start_dt.isoformat(),
+                'endTime': end_dt.isoformat(),
+                'compartmentId': target_compartment
+            },
+            'method': method,
+            'loganCompatible': True,
+            'retrievedAt': utc_timestamp(),
+            'service': 'OCI Monitoring',
+            'operationType': 'query_compute_metrics_batch'
+        }
+        
+        return response
+        
+    except Exception as e:
+        logger.error("Error querying batch compute metrics: %s", e)
+        return {
+            'error': f"Failed to query batch compute metrics: {str(e)}",
+            'success': False,
+            'retrievedAt': utc_timestamp()
+        }
+
+# Connection test probe messages
+MSG_COMPUTE_OK = 'Compute service accessible - found {count} running instances'
+MSG_COMPUTE_NO_COMPARTMENT = 'Compute client available but no compartment ID configured'
+MSG_COMPUTE_UNAVAILABLE = 'Compute client not available'
+MSG_COMPUTE_CIRCUIT_OPEN = 'Compute service test skipped: circuit open after repeated failures'
+MSG_COMPUTE_FAIL = 'Compute service test failed: {error}'
+MSG_MONITORING_OK = 'Monitoring client available'
+MSG_MONITORING_UNAVAILABLE = 'Monitoring client not available'
+
+# Fixed probe results, shared read-only; the connection test copies them into its own result dicts
+COMPUTE_CIRCUIT_OPEN_RESULT = types.MappingProxyType({'status': 'failed', 'message': MSG_COMPUTE_CIRCUIT_OPEN})
+COMPUTE_UNAVAILABLE_RESULT = types.MappingProxyType({'status': 'failed', 'message': MSG_COMPUTE_UNAVAILABLE})
+COMPUTE_NO_COMPARTMENT_RESULT = types.MappingProxyType({'status': 'warning', 'message': MSG_COMPUTE_NO_COMPARTMENT})
+MONITORING_OK_RESULT = types.MappingProxyType({'status': 'success', 'message': MSG_MONITORING_OK})
+MONITORING_UNAVAILABLE_RESULT = types.MappingProxyType({'status': 'failed', 'message': MSG_MONITORING_UNAVAILABLE})
+
+async def _probe_compute(deep: bool = False) -> Mapping[str, Any]:
+    """Check the compute service with a single-page request, or a full listing if deep"""
+    if time.monotonic() < _compute_breaker['open_until']:
+        return COMPUTE_CIRCUIT_OPEN_RESULT
+    
+    # The capability check is free; the property builds the client (dropping the capability if that fails)
+    if 'compute' not in oci_manager.capabilities or not oci_manager.compute_client:
+        return COMPUTE_UNAVAILABLE_RESULT
+    
+    try:
+        compartment_id = oci_manager.get_compartment_id()
+        if compartment_id:
+            if deep:
+                instance_count = len(await oci_manager.list_instances_sdk(compartment_id, "RUNNING"))
+            else:
+                instance_count = await oci_manager.probe_instances_sdk(compartment_id, "RUNNING")
+            return {
+                'status': 'success',
+                'message': MSG_COMPUTE_OK.format(count=instance_count),
+                'instance_count': instance_count
+            }
+        return COMPUTE_NO_COMPARTMENT_RESULT
+    except (oci.exceptions.ServiceError, oci.exceptions.RequestException, ConnectionError, TimeoutError) as e:
+        e = e.with_traceback(None)
+        return {
+            'status': 'failed',
+            'message': MSG_COMPUTE_FAIL.format(error=short_error(e))
         }
 
+async def _probe_monitoring(deep: bool = False) -> Mapping[str, Any]:
+    """Check that the monitoring client can be constructed"""
+    if 'monitoring' in oci_manager.capabilities:
+        return MONITORING_OK_RESULT
+    return MONITORING_UNAVAILABLE_RESULT
+
+# Last connection test result, reused for HEALTH_TTL_SECONDS
+_health_cache = {'ts': 0.0, 'result': None}
+_health_lock = asyncio.Lock()
+
+# Circuit breaker for the compute probe, so a down backend is not probed on every call
+_compute_breaker = {'fails': 0, 'open_until': 0.0}
+
+def _record_compute_probe(succeeded: bool) -> None:
+    """Reset the compute circuit breaker on success, or count a failure and open it at the threshold"""
+    if succeeded:
+        _compute_breaker['fails'] = 0
+        return
+    _compute_breaker['fails'] += 1
+    if _compute_breaker['fails'] >= BREAKER_FAILURE_THRESHOLD:
+        _compute_breaker['open_until'] = time.monotonic() + BREAKER_COOLDOWN_SECONDS
+
+def _compute_breaker_state() -> Dict[str, Any]:
+    """Current compute circuit breaker state for connection test results"""
+    remaining = _compute_breaker['open_until'] - time.monotonic()
+    return {
+        'state': 'open' if remaining > 0 else 'closed',
+        'consecutive_failures': _compute_breaker['fails'],
+        'retry_in_seconds': round(max(remaining, 0.0), 1)
+    }
+
+# Service probes run concurrently by test_oci_connection, keyed by result name
+SERVICE_PROBES = {
+    'compute_service': _probe_compute,
+    'monitoring_service': _probe_monitoring
+}
+
+# Recent probe durations in ms, for the rolling percentiles reported by test_oci_connection
+PROBE_DURATION_SAMPLES = 128
+_probe_durations = {name: deque(maxlen=PROBE_DURATION_SAMPLES) for name in SERVICE_PROBES}
+
 @mcp.tool()
-async def test_oci_connection() -> Dict[str, Any]:
+async def test_oci_connection(force_refresh: bool = False, deep: bool = False) -> Dict[str, Any]:
     """
     Test connectivity to OCI services and validate configuration.
     
+    Args:
+        force_refresh: Re-run the probes even if a recent result is cached
+        deep: Fully enumerate running instances instead of a single-page check (never cached)
+    
     Returns:
         Dictionary containing connection test results
     """
+    if deep:
+        return await _run_connection_test(deep=True)
+    
+    if not force_refresh:
+        cached = _cached_health_result()
+        if cached:
+            return cached
+    
+    # Only one caller runs the probes; concurrent callers wait and reuse its result
+    async with _health_lock:
+        if not force_refresh:
+            cached = _cached_health_result()
+            if cached:
+                return cached
+        
+        results = await _run_connection_test()
+        _health_cache['ts'] = time.monotonic()
+        _health_cache['result'] = results
+        return results
+
+def _cached_health_result() -> Optional[Dict[str, Any]]:
+    """Return a copy of the cached connection test result if it is still fresh"""
+    if _health_cache['result'] and time.monotonic() - _health_cache['ts'] < HEALTH_TTL_SECONDS:
+        result = copy.copy(_health_cache['result'])
+        result['timestamp'] = utc_timestamp()
+        return result
+    return None
+
+def warm_up() -> None:
+    """Build the SDK clients, open the first TLS connection and seed the connection test cache"""
     try:
-        results = {
-            'timestamp': datetime.utcnow().isoformat(),
-            'service': 'OCI Connection Test',
-            'tests': {}
-        }
+        # The connection test only builds the compute client
+        oci_manager.monitoring_client
+        oci_manager.network_client
+        results = asyncio.run(_run_connection_test())
+        _health_cache['ts'] = time.monotonic()
+        _health_cache['result'] = results
+        logger.info("OCI warm-up finished: %s", results.get('overall_status'))
+    except Exception as e:
+        logger.warning("OCI warm-up failed: %s", e)
+
+async def _timed_probe(probe, deep: bool) -> tuple:
+    """Run a service probe under the probe timeout, returning its result (or None on timeout) and duration in ms
+    
+    Probes report SDK and network failures themselves, so any other exception is a bug and propagates.
+    """
+    start = time.perf_counter_ns()
+    try:
+        result = await asyncio.wait_for(probe(deep), PROBE_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        result = None
+    return result, (time.perf_counter_ns() - start) // 1_000_000
+
+def _probe_latency() -> Dict[str, Any]:
+    """Rolling p50/p95 of recent probe durations"""
+    latency = {}
+    for name, durations in _probe_durations.items():
+        if durations:
+            ordered = sorted(durations)
+            latency[name] = {
+                'samples': len(ordered),
+                'p50_ms': nearest_rank(ordered, 0.5),
+                'p95_ms': nearest_rank(ordered, 0.95)
+            }
+    return latency
+
+async def _run_connection_test(deep: bool = False) -> Dict[str, Any]:
+    """Probe OCI services and aggregate the results"""
+    now = utc_timestamp()
+    start = time.perf_counter_ns()
+    try:
+        # All test keys up front, in report order
+        tests = dict.fromkeys(('sdk_config', *SERVICE_PROBES))
         
         # Test SDK availability
         if oci_manager.config:
-            results['tests']['sdk_config'] = {
+            tests['sdk_config'] = {
                 'status': 'success',
                 'message': 'OCI SDK configuration loaded',
                 'region': oci_manager.config.get('region', 'unknown'),
                 'tenancy': oci_manager.config.get('tenancy', '')[:20] + '...'
             }
         else:
-            results['tests']['sdk_config'] = {
+            tests['sdk_config'] = {
                 'status': 'failed',
                 'message': 'OCI SDK configuration not available'
             }
         
-        # Test compute client
-        if oci_manager.compute_client:
-            try:
-                compartment_id = oci_manager.get_compartment_id()
-                if compartment_id:
-                    instances = await oci_manager.list_instances_sdk(compartment_id, "RUNNING")
-                    results['tests']['compute_service'] = {
-                        'status': 'success',
-                        'message': f'Compute service accessible - found {len(instances)} running instances',
-                        'instance_count': len(instances)
-                    }
-                else:
-                    results['tests']['compute_service'] = {
-                        'status': 'warning',
-                        'message': 'Compute client available but no compartment ID configured'
-                    }
-            except Exception as e:
-                results['tests']['compute_service'] = {
+        # Run the independent service probes concurrently, each bounded by a timeout
+        probe_results = await asyncio.gather(
+            *[_timed_probe(probe, deep) for probe in SERVICE_PROBES.values()]
+        )
+        for name, (probe_result, duration_ms) in zip(SERVICE_PROBES, probe_results):
+            if probe_result is None:
+                probe_result = {
                     'status': 'failed',
-                    'message': f'Compute service test failed: {str(e)[:100]}...'
+                    'message': f'Probe timed out after {PROBE_TIMEOUT_SECONDS}s'
                 }
-        else:
-            results['tests']['compute_service'] = {
-                'status': 'failed',
-                'message': 'Compute client not available'
-            }
+            # Short-circuited probes would drag the percentiles toward 0 while the backend is down
+            if probe_result is not COMPUTE_CIRCUIT_OPEN_RESULT:
+                _probe_durations[name].append(duration_ms)
+            if name == 'compute_service':
+                # Results served while the circuit is open must not extend it
+                if probe_result is not COMPUTE_CIRCUIT_OPEN_RESULT:
+                    _record_compute_probe(probe_result['status'] != 'failed')
+                tests[name] = {**probe_result, 'duration_ms': duration_ms, 'circuit_breaker': _compute_breaker_state()}
+            else:
+                tests[name] = {**probe_result, 'duration_ms': duration_ms}
         
-        # Test monitoring client
-        if oci_manager.monitoring_client:
-            results['tests']['monitoring_service'] = {
-                'status': 'success',
-                'message': 'Monitoring client available'
-            }
-        else:
-            results['tests']['monitoring_service'] = {
-                'status': 'failed',
-                'message': 'Monitoring client not available'
-            }
+        # Report shared connection pool state so keep-alive reuse regressions are visible
+        connection_pool = oci_manager.pool_stats()
+        logger.info("OCI connection pool: %s", connection_pool)
         
         # Overall status
-        failed_tests = [test for test in results['tests'].values() if test['status'] == 'failed']
-        if not failed_tests:
-            results['overall_status'] = 'success'
-            results['message'] = 'All OCI services accessible'
+        failed = warned = total = 0
+        for test in tests.values():
+            total += 1
+            status = test['status']
+            failed += status == 'failed'
+            warned += status == 'warning'
+        if failed == 0 and warned == 0:
+            overall_status = 'success'
+            message = 'All OCI services accessible'
         else:
-            results['overall_status'] = 'partial' if len(failed_tests) < len(results['tests']) else 'failed'
-            results['message'] = f'{len(failed_tests)} out of {len(results["tests"])} tests failed'
+            overall_status = 'partial' if failed < total else 'failed'
+            if failed:
+                message = f'{failed} out of {total} tests failed'
+            else:
+                message = f'{warned} out of {total} tests reported warnings'
         
-        return results
-        
-    except Exception as e:
-        logger.error(f"Connection test failed: {e}")
         return {
-            'overall_status': 'failed',
-            'message': f'Connection test failed: {str(e)}',
-            'timestamp': datetime.utcnow().isoformat(),
-            'error': str(e)
+            'timestamp': now,
+            'service': 'OCI Connection Test',
+            'tests': tests,
+            'total_ms': (time.perf_counter_ns() - start) // 1_000_000,
+            'latency': _probe_latency(),
+            'connection_pool': connection_pool,
+            'overall_status': overall_status,
+            'message': message
         }
+        
+    except Exception as e:
+        # SDK and network failures are reported per probe by _timed_probe, so anything here is a bug
+        logger.error("Connection test failed unexpectedly: %s", e)
+        raise
 
 if __name__ == "__main__":
-    # Print startup information
-    print("🚀 Starting OCI FastMCP Server with Python SDK...", file=sys.stderr)
-    print("📋 Available tools:", file=sys.stderr)
-    print("   - list_compute_instances: List instances with basic details", file=sys.stderr)
-    print("   - list_instances_with_network: List instances with network information", file=sys.stderr)
-    print("   - get_instance_details: Get comprehensive instance details", file=sys.stderr)
-    print("   - query_compute_metrics: Query Compute Agent metrics", file=sys.stderr)
-    print("   - test_oci_connection: Test OCI connectivity", file=sys.stderr)
-    print("", file=sys.stderr)
-    print("⚙️  Configuration:", file=sys.stderr)
-    print(f"   - OCI SDK Available: {'✅' if oci_manager.compute_client else '❌'}", file=sys.stderr)
-    print(f"   - Region: {oci_manager.config.get('region', 'Not configured') if oci_manager.config else 'Not configured'}", file=sys.stderr)
-    print(f"   - Compartment ID: {oci_manager.get_compartment_id() or '❌ Not set'}", file=sys.stderr)
-    print("", file=sys.stderr)
+    sdk_version = oci_sdk_version()
+    if EXPECT_HEADER_REGRESSION_VERSIONS[0] <= sdk_version_tuple(sdk_version) < EXPECT_HEADER_REGRESSION_VERSIONS[1]:
+        logger.warning(
+            "OCI SDK %s is affected by the Expect-header latency regression; "
+            "OCI_PYSDK_USING_EXPECT_HEADER=%s. Upgrade the oci package.",
+            sdk_version, os.environ['OCI_PYSDK_USING_EXPECT_HEADER']
+        )
+    
+    # Print startup information as a single write; skipped when stderr is not a terminal (unless
+    # MCP_OCI_QUIET=0), and emoji only on an interactive terminal
+    if not QUIET:
+        fancy = sys.stderr.isatty()
+        ok, missing = ('✅', '❌') if fancy else ('yes', 'no')
+        region = oci_manager.config.get('region', 'Not configured') if oci_manager.config else 'Not configured'
+        compartment_id = oci_manager.get_compartment_id()
+        banner = "\n".join([
+            f"{'🚀 ' if fancy else ''}Starting OCI FastMCP Server with Python SDK...",
+            f"{'📋 ' if fancy else ''}Available tools:",
+            "   - list_compute_instances: List instances with basic details",
+            "   - list_instances_with_network: List instances with network information",
+            "   - get_instance_details: Get comprehensive instance details",
+            "   - query_compute_metrics: Query Compute Agent metrics",
+            "   - query_compute_metrics_batch: Query Compute Agent metrics for many instances",
+            "   - test_oci_connection: Test OCI connectivity",
+            "",
+            f"{'⚙️  ' if fancy else ''}Configuration:",
+            f"   - OCI SDK Available: {ok if oci_manager.has_config() else missing}",
+            f"   - OCI SDK Version: {sdk_version} (Expect header: {os.environ['OCI_PYSDK_USING_EXPECT_HEADER']})",
+            f"   - Region: {region}",
+            f"   - Compartment ID: {compartment_id or missing + ' Not set'}",
+            "",
+        ])
+        sys.stderr.write(banner + "\n")
+        sys.stderr.flush()
+    
+    # Pay client construction and the first signed request off the critical path
+    if os.getenv("MCP_OCI_WARMUP", "1") == "1" and oci_manager.has_config():
+        # Finish the lazy SDK import here: LazyLoader modules are not safe to load from two threads at once
+        importlib.import_module("oci.core")
+        threading.Thread(target=warm_up, name="oci-warmup", daemon=True).start()
     
     # Run the FastMCP server
     mcp.run()
\ No newline at end of file